@@ -0,0 +1,82 @@
+"""Persistent on-disk cache for SEC API responses with conditional GET.
+
+SEC payloads change at most daily but carry ``ETag``/``Last-Modified``
+validators.  Cached responses younger than the TTL are served straight from
+disk; stale ones are revalidated with ``If-None-Match``/``If-Modified-Since``,
+so an unchanged payload costs a <1 KB ``304`` instead of a multi-MB download
+and re-parse.
+"""
+
+import functools
+import os
+import time
+
+from sec_edgar.config import CACHE_DIR
+from sec_edgar import fastjson, http_client
+
+
+def _paths(kind: str, cache_key: str) -> tuple[str, str]:
+    base = os.path.join(CACHE_DIR, kind)
+    return os.path.join(base, f"{cache_key}.json"), os.path.join(
+        base, f"{cache_key}.meta"
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_cached(body_path: str, mtime_ns: int):
+    """Parse a cached body, memoised on (path, mtime) for intra-process reuse."""
+    with open(body_path, "rb") as f:
+        return fastjson.loads(f.read())
+
+
+def get_json(
+    url: str,
+    kind: str,
+    cache_key: str,
+    user_agent: str | None = None,
+    ttl_hours: float = 24,
+):
+    """
+    Fetch *url* as JSON through the disk cache.
+
+    ``kind`` namespaces the cache (e.g. ``"facts"``, ``"submissions"``) and
+    ``cache_key`` identifies the entry (usually the CIK).
+    """
+    body_path, meta_path = _paths(kind, cache_key)
+
+    meta: dict = {}
+    if os.path.exists(body_path) and os.path.exists(meta_path):
+        with open(meta_path, "rb") as f:
+            meta = fastjson.loads(f.read())
+        age_hours = (time.time() - os.path.getmtime(body_path)) / 3600
+        if age_hours < ttl_hours:
+            return _parse_cached(body_path, os.stat(body_path).st_mtime_ns)
+
+    validators = {}
+    if meta.get("etag"):
+        validators["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        validators["If-Modified-Since"] = meta["last_modified"]
+
+    resp = http_client.get(url, user_agent=user_agent, extra_headers=validators)
+
+    if resp.status_code == 304:
+        # Unchanged upstream — refresh the TTL clock and reuse the parse.
+        os.utime(body_path)
+        return _parse_cached(body_path, os.stat(body_path).st_mtime_ns)
+
+    data = fastjson.loads(resp.content)
+    os.makedirs(os.path.dirname(body_path), exist_ok=True)
+    with open(body_path, "wb") as f:
+        f.write(resp.content)
+    with open(meta_path, "wb") as f:
+        f.write(
+            fastjson.dumps(
+                {
+                    "etag": resp.headers.get("ETag"),
+                    "last_modified": resp.headers.get("Last-Modified"),
+                    "url": url,
+                }
+            )
+        )
+    return data
@@ -1,18 +1,52 @@
 """Stage 1 — Resolve ticker symbols to SEC CIK identifiers."""
 
-import json
+import functools
 import os
+import pickle
 import time
 from difflib import get_close_matches
 
 from sec_edgar.config import CACHE_DIR, TICKER_MAP_URL, TICKER_CACHE_MAX_AGE_HOURS
-from sec_edgar import http_client
+from sec_edgar import fastjson, http_client
+
+try:
+    from rapidfuzz import fuzz as _rf_fuzz
+    from rapidfuzz import process as _rf_process
+except ImportError:  # pragma: no cover - exercised only without the extra
+    _rf_process = None
+
+
+def _suggest(key: str, all_tickers: list[str]) -> list[str]:
+    """Return up to 5 tickers that look like *key*, best match first.
+
+    Uses rapidfuzz (SIMD Levenshtein, 10-100× faster than difflib on the
+    ~13k-entry ticker list) when installed; otherwise falls back to
+    difflib's pure-Python matcher.
+    """
+    if _rf_process is not None:
+        matches = _rf_process.extract(
+            key, all_tickers, scorer=_rf_fuzz.WRatio, limit=5, score_cutoff=60
+        )
+        return [m[0] for m in matches]
+    return get_close_matches(key, all_tickers, n=5, cutoff=0.6)
 
 
 def _cache_path() -> str:
     return os.path.join(CACHE_DIR, "company_tickers.json")
 
 
+def _index_path() -> str:
+    """Pickled ticker-keyed index built from the raw SEC file."""
+    return _cache_path() + ".idx"
+
+
+@functools.lru_cache(maxsize=1)
+def _load_index(mtime_ns: int) -> dict:
+    """Load the pickled index, memoised per process on its mtime."""
+    with open(_index_path(), "rb") as f:
+        return pickle.load(f)
+
+
 def _cache_is_fresh() -> bool:
     path = _cache_path()
     if not os.path.exists(path):
@@ -25,25 +59,60 @@ def _load_ticker_map(user_agent: str | None = None) -> dict:
     """
     Return ``{TICKER: {"cik_str": int, "ticker": str, "title": str}, ...}``.
 
-    Uses a local file cache that refreshes daily.
+    Uses a local file cache that refreshes daily.  The rebuilt ticker-keyed
+    dict is pickled alongside the raw file so repeat runs skip both the JSON
+    parse and the ~13k-entry rebuild pass, and is memoised for the process.
     """
     if _cache_is_fresh():
-        with open(_cache_path()) as f:
-            raw = json.load(f)
+        # Prefer the pickled index if it is at least as new as the raw file.
+        try:
+            idx_stat = os.stat(_index_path())
+            if idx_stat.st_mtime >= os.path.getmtime(_cache_path()):
+                return _load_index(idx_stat.st_mtime_ns)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+        with open(_cache_path(), "rb") as f:
+            raw = fastjson.loads(f.read())
     else:
         resp = http_client.get(TICKER_MAP_URL, user_agent=user_agent)
-        raw = resp.json()
+        raw = fastjson.loads(resp.content)
         os.makedirs(CACHE_DIR, exist_ok=True)
-        with open(_cache_path(), "w") as f:
-            json.dump(raw, f)
+        with open(_cache_path(), "wb") as f:
+            f.write(fastjson.dumps(raw))
 
     # The SEC file is keyed by index ("0", "1", …). Build a ticker-keyed dict.
     ticker_map: dict[str, dict] = {}
     for entry in raw.values():
         ticker_map[entry["ticker"].upper()] = entry
+
+    try:
+        with open(_index_path(), "wb") as f:
+            pickle.dump(ticker_map, f, protocol=5)
+    except OSError:
+        pass  # index is purely an optimisation; the raw cache still works
     return ticker_map
 
 
+@functools.lru_cache(maxsize=4096)
+def resolve_one(ticker: str, user_agent: str | None = None) -> str:
+    """
+    Resolve a single ticker to a zero-padded 10-digit CIK string.
+
+    Cached per process — CIKs are stable for months, so repeated lookups
+    (e.g. long-running callers resolving the same ticker per job) skip the
+    ticker-map load entirely.  Raises ``KeyError`` with suggestions for
+    unknown tickers (failures are not cached).
+    """
+    key = ticker.strip().upper()
+    ticker_map = _load_ticker_map(user_agent=user_agent)
+    entry = ticker_map.get(key)
+    if entry is None:
+        close = _suggest(key, list(ticker_map.keys()))
+        hint = f" Did you mean: {', '.join(close)}?" if close else ""
+        raise KeyError(f"Ticker '{key}' not found in SEC data.{hint}")
+    return str(entry["cik_str"]).zfill(10)
+
+
 def resolve(
     tickers: list[str],
     user_agent: str | None = None,
@@ -54,18 +123,7 @@ def resolve(
     Returns ``{TICKER: "0000320193", ...}``.
     Raises ``KeyError`` for any ticker that cannot be found (with suggestions).
     """
-    ticker_map = _load_ticker_map(user_agent=user_agent)
-    results: dict[str, str] = {}
-    all_tickers = list(ticker_map.keys())
-
-    for t in tickers:
-        key = t.strip().upper()
-        if key in ticker_map:
-            cik = ticker_map[key]["cik_str"]
-            results[key] = str(cik).zfill(10)
-        else:
-            close = get_close_matches(key, all_tickers, n=5, cutoff=0.6)
-            hint = f" Did you mean: {', '.join(close)}?" if close else ""
-            raise KeyError(f"Ticker '{key}' not found in SEC data.{hint}")
-
-    return results
+    return {
+        t.strip().upper(): resolve_one(t.strip().upper(), user_agent)
+        for t in tickers
+    }
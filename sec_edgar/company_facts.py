@@ -1,7 +1,16 @@
 """Stage 3 — Fetch XBRL company facts from SEC EDGAR."""
 
-from sec_edgar.config import COMPANY_FACTS_URL, COMPANY_CONCEPT_URL
-from sec_edgar import http_client
+from concurrent.futures import ThreadPoolExecutor
+
+from sec_edgar.config import (
+    COMPANY_FACTS_URL,
+    COMPANY_CONCEPT_URL,
+    PRIORITY_CONCEPTS,
+    TAG_ALIASES,
+)
+from sec_edgar import cache, fastjson, http_client
+
+_PRIORITY_TAGS = frozenset(PRIORITY_CONCEPTS)
 
 
 def fetch(cik: str, user_agent: str | None = None) -> dict:
@@ -13,7 +22,7 @@ def fetch(cik: str, user_agent: str | None = None) -> dict:
     """
     url = COMPANY_FACTS_URL.format(cik=cik)
     try:
-        data = http_client.get(url, user_agent=user_agent).json()
+        data = cache.get_json(url, "facts", cik, user_agent=user_agent)
     except Exception:
         # Company may not have XBRL data (e.g., foreign private issuers)
         return {}
@@ -33,13 +42,116 @@ def fetch_concept(
     """
     url = COMPANY_CONCEPT_URL.format(cik=cik, taxonomy=taxonomy, tag=tag)
     try:
-        data = http_client.get(url, user_agent=user_agent).json()
+        data = fastjson.loads(http_client.get(url, user_agent=user_agent).content)
     except Exception:
         return {}
     return data
 
 
-def extract_facts_flat(facts_data: dict) -> list[dict]:
+def fetch_priority(cik: str, user_agent: str | None = None) -> dict:
+    """
+    Fetch only the priority concepts via the per-concept API.
+
+    The bulk companyfacts payload is multi-MB, 90 % of which is discarded
+    on the ``--priority-only`` path; each ``companyconcept`` response is a
+    few KB, so fetching them concurrently transfers far less.  Alias
+    variants that canonicalise into the priority set are included so older
+    filers (e.g. SalesRevenueNet) aren't missed.
+
+    Returns data in the same nested shape as :func:`fetch`.  Falls back to
+    the bulk endpoint if no concept returns any data.
+    """
+    tags = sorted(
+        _PRIORITY_TAGS
+        | {t for t, canon in TAG_ALIASES.items() if canon in _PRIORITY_TAGS}
+    )
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = pool.map(
+            lambda t: (t, fetch_concept(cik, "us-gaap", t, user_agent=user_agent)),
+            tags,
+        )
+
+    concepts: dict[str, dict] = {}
+    for tag, data in results:
+        units = data.get("units")
+        if units:
+            concepts[tag] = {
+                "label": data.get("label") or tag,
+                "description": data.get("description") or "",
+                "units": units,
+            }
+
+    if not concepts:
+        return fetch(cik, user_agent=user_agent)
+    return {"facts": {"us-gaap": concepts}}
+
+
+# Field order for the tuple records yielded by extract_facts_flat_records().
+FLAT_FIELDS = (
+    "taxonomy",
+    "tag",
+    "label",
+    "description",
+    "unit",
+    "value",
+    "end",
+    "start",
+    "fy",
+    "fp",
+    "form",
+    "filed",
+    "accn",
+)
+
+
+def extract_facts_flat_records(facts_data: dict, priority_only: bool = False):
+    """
+    Yield one tuple per XBRL entry, in ``FLAT_FIELDS`` order.
+
+    Large filers have ~100k entries; yielding tuples instead of building a
+    dict per entry avoids most of the allocator and dict-hashing work on
+    this hot loop.  Consumers that need dict form can use
+    ``_row_from_tuple``.
+
+    With ``priority_only`` set, concepts whose canonical tag is not in
+    ``PRIORITY_CONCEPTS`` are skipped before any records are built, so
+    ~90 % of the subtrees never allocate anything.
+    """
+    alias_get = TAG_ALIASES.get
+    facts = facts_data.get("facts", {})
+    for taxonomy, concepts in facts.items():
+        for tag, tag_data in concepts.items():
+            if priority_only and alias_get(tag, tag) not in _PRIORITY_TAGS:
+                continue
+            label = tag_data.get("label", tag)
+            description = tag_data.get("description", "")
+            units = tag_data.get("units", {})
+            for unit, entries in units.items():
+                for entry in entries:
+                    g = entry.get
+                    yield (
+                        taxonomy,
+                        tag,
+                        label,
+                        description,
+                        unit,
+                        g("val"),
+                        g("end"),
+                        g("start"),
+                        g("fy"),
+                        g("fp"),
+                        g("form"),
+                        g("filed"),
+                        g("accn"),
+                    )
+
+
+def _row_from_tuple(record: tuple) -> dict:
+    """Build the dict form of a ``FLAT_FIELDS`` tuple record."""
+    return dict(zip(FLAT_FIELDS, record))
+
+
+def extract_facts_flat(facts_data: dict, priority_only: bool = False) -> list[dict]:
     """
     Flatten the nested Company Facts response into a list of records.
 
@@ -59,29 +171,7 @@ def extract_facts_flat(facts_data: dict) -> list[dict]:
             "accn": "0000320193-23-000106",
         }
     """
-    rows: list[dict] = []
-    facts = facts_data.get("facts", {})
-    for taxonomy, concepts in facts.items():
-        for tag, tag_data in concepts.items():
-            label = tag_data.get("label", tag)
-            description = tag_data.get("description", "")
-            units = tag_data.get("units", {})
-            for unit, entries in units.items():
-                for entry in entries:
-                    row = {
-                        "taxonomy": taxonomy,
-                        "tag": tag,
-                        "label": label,
-                        "description": description,
-                        "unit": unit,
-                        "value": entry.get("val"),
-                        "end": entry.get("end"),
-                        "start": entry.get("start"),
-                        "fy": entry.get("fy"),
-                        "fp": entry.get("fp"),
-                        "form": entry.get("form"),
-                        "filed": entry.get("filed"),
-                        "accn": entry.get("accn"),
-                    }
-                    rows.append(row)
-    return rows
+    return [
+        _row_from_tuple(record)
+        for record in extract_facts_flat_records(facts_data, priority_only)
+    ]
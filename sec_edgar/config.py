@@ -20,6 +20,11 @@ USER_AGENT = os.environ.get(
 # Rate limiting
 MAX_REQUESTS_PER_SECOND = 8  # SEC cap is 10; stay conservative
 REQUEST_DELAY = 1.0 / MAX_REQUESTS_PER_SECOND
+BURST_CAPACITY = 10  # short bursts up to SEC's real cap are allowed
+
+# Concurrency — tickers processed in parallel; all workers share the same
+# rate limiter, so this bounds in-flight requests, not the request rate.
+MAX_TICKER_WORKERS = 4
 
 # Retry / backoff
 MAX_RETRIES = 3
@@ -57,5 +62,5 @@ TAG_ALIASES = {
     "NetIncomeLossAvailableToCommonStockholdersBasic": "NetIncomeLoss",
 }
 
-# Filing form types worth flagging
-KEY_FORM_TYPES = {"10-K", "10-Q", "8-K", "DEF 14A", "S-1"}
+# Filing form types worth flagging (frozen — membership tested per filing)
+KEY_FORM_TYPES = frozenset({"10-K", "10-Q", "8-K", "DEF 14A", "S-1"})
@@ -0,0 +1,28 @@
+"""JSON helpers that use orjson when available, stdlib ``json`` otherwise.
+
+orjson's C parser is 3-8× faster than stdlib on the multi-MB SEC payloads,
+but it is an optional dependency (``pip install sec-edgar-cli[speed]``) —
+everything works without it.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None
+
+
+def loads(data: bytes | str):
+    """Parse JSON from bytes (or str) into Python objects."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent: bool = False, default=None) -> bytes:
+    """Serialise *obj* to JSON bytes, optionally indented (2 spaces)."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option, default=default)
+    return json.dumps(obj, indent=2 if indent else None, default=default).encode()
@@ -1,46 +1,106 @@
 """Shared HTTP client with rate limiting, retries, and SEC-compliant headers."""
 
+import threading
 import time
+
 import requests
+from requests.adapters import HTTPAdapter
 
 from sec_edgar.config import (
     MAX_RETRIES,
     BACKOFF_BASE,
-    REQUEST_DELAY,
+    BURST_CAPACITY,
+    MAX_REQUESTS_PER_SECOND,
     USER_AGENT,
 )
 
-_last_request_time = 0.0
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+
+    Allows bursts up to *capacity* requests while keeping the long-run
+    average at *refill_rate* requests per second.  Unlike a fixed
+    inter-request delay, concurrent callers only block when the bucket is
+    actually empty.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity,
+            self.tokens + (now - self.last_refill) * self.refill_rate,
+        )
+        self.last_refill = now
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available; never blocks."""
+        with self._lock:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+    def acquire(self) -> None:
+        """Take a token, sleeping until one becomes available."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.refill_rate
+            time.sleep(wait)
+
+
+_bucket = TokenBucket(BURST_CAPACITY, MAX_REQUESTS_PER_SECOND)
+
+# Shared session: keep-alive connections amortise TCP+TLS handshakes
+# (1-2 RTT each) across all requests for all tickers.
+_session = requests.Session()
+_session.headers.update({"Accept-Encoding": "gzip, deflate"})
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
 
 
 def _rate_limit():
-    """Block until enough time has elapsed since the last request."""
-    global _last_request_time
-    now = time.monotonic()
-    elapsed = now - _last_request_time
-    if elapsed < REQUEST_DELAY:
-        time.sleep(REQUEST_DELAY - elapsed)
-    _last_request_time = time.monotonic()
+    """Block until the shared token bucket grants a request slot."""
+    _bucket.acquire()
 
 
-def get(url: str, user_agent: str | None = None) -> requests.Response:
+def get(
+    url: str,
+    user_agent: str | None = None,
+    extra_headers: dict | None = None,
+) -> requests.Response:
     """
     GET *url* with rate limiting, retries, and the required User-Agent header.
 
+    *extra_headers* are merged into the request (e.g. conditional-GET
+    validators); a ``304 Not Modified`` response is returned as-is.
+
     Raises ``requests.HTTPError`` after exhausting retries on 4xx/5xx responses
     (except 403/429 which trigger backoff).
     """
     ua = user_agent or USER_AGENT
-    headers = {
-        "User-Agent": ua,
-        "Accept-Encoding": "gzip, deflate",
-    }
+    headers = {"User-Agent": ua}
+    if extra_headers:
+        headers.update(extra_headers)
 
     for attempt in range(MAX_RETRIES + 1):
         _rate_limit()
-        resp = requests.get(url, headers=headers, timeout=30)
+        resp = _session.get(url, headers=headers, timeout=30)
 
-        if resp.status_code == 200:
+        if resp.status_code in (200, 304):
             return resp
 
         if resp.status_code in (403, 429) and attempt < MAX_RETRIES:
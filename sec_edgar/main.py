@@ -3,12 +3,13 @@
 import argparse
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from sec_edgar import cik_resolver, submissions, company_facts, http_client
-from sec_edgar.company_facts import extract_facts_flat
-from sec_edgar.normalizer import normalize
+from sec_edgar.company_facts import extract_facts_flat_records
+from sec_edgar.normalizer import normalize_records
 from sec_edgar.storage import write_csv, write_json, write_sqlite
-from sec_edgar.config import USER_AGENT
+from sec_edgar.config import USER_AGENT, MAX_TICKER_WORKERS
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -85,6 +86,7 @@ def _run_ticker(
 ) -> dict:
     """Fetch, normalise, and store data for a single ticker. Returns summary."""
     ua = args.user_agent
+    print(f"\nProcessing {ticker} …")
     result: dict = {"ticker": ticker, "cik": cik}
 
     # ── Submissions ──────────────────────────────────────────────────────
@@ -93,9 +95,10 @@ def _run_ticker(
         sub = submissions.fetch(cik, user_agent=ua)
         result["company"] = sub["company"]
         filings = sub["filings"]
-        if args.forms:
-            form_set = {f.upper() for f in args.forms}
-            filings = [f for f in filings if f.get("form", "").upper() in form_set]
+        if args.form_set:
+            filings = [
+                f for f in filings if f.get("form", "").upper() in args.form_set
+            ]
         result["filings"] = filings
         print(f"  [{ticker}] {len(filings)} filings retrieved.")
     else:
@@ -105,10 +108,15 @@ def _run_ticker(
     # ── Company Facts ────────────────────────────────────────────────────
     if not args.filings_only:
         print(f"  [{ticker}] Fetching company facts …")
-        raw_facts = company_facts.fetch(cik, user_agent=ua)
+        if args.priority_only:
+            raw_facts = company_facts.fetch_priority(cik, user_agent=ua)
+        else:
+            raw_facts = company_facts.fetch(cik, user_agent=ua)
         if raw_facts:
-            flat = extract_facts_flat(raw_facts)
-            rows = normalize(flat, priority_only=args.priority_only)
+            records = extract_facts_flat_records(
+                raw_facts, priority_only=args.priority_only
+            )
+            rows = normalize_records(records, priority_only=args.priority_only)
             result["facts"] = rows
             print(f"  [{ticker}] {len(rows)} fact records after normalisation.")
         else:
@@ -152,6 +160,9 @@ def main(argv: list[str] | None = None) -> int:
     ua = args.user_agent or USER_AGENT
     args.user_agent = ua
 
+    # Precompute the form filter once; args is shared by all ticker workers.
+    args.form_set = frozenset(f.upper() for f in args.forms) if args.forms else None
+
     # ── Stage 1: Resolve tickers ─────────────────────────────────────────
     print("Resolving tickers …")
     try:
@@ -163,14 +174,21 @@ def main(argv: list[str] | None = None) -> int:
     for ticker, cik in cik_map.items():
         print(f"  {ticker} → CIK {cik}")
 
-    # ── Stages 2-4: Fetch & process each ticker ─────────────────────────
-    for ticker, cik in cik_map.items():
-        print(f"\nProcessing {ticker} …")
-        try:
-            _run_ticker(ticker, cik, args)
-        except Exception as exc:
-            print(f"  [{ticker}] Error: {exc}", file=sys.stderr)
-            continue
+    # ── Stages 2-4: Fetch & process tickers concurrently ────────────────
+    # The workload is network-bound; workers overlap their SEC fetches
+    # while sharing the rate limiter in http_client.
+    workers = min(MAX_TICKER_WORKERS, len(cik_map)) or 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_run_ticker, ticker, cik, args): ticker
+            for ticker, cik in cik_map.items()
+        }
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                future.result()
+            except Exception as exc:
+                print(f"  [{ticker}] Error: {exc}", file=sys.stderr)
 
     print("\nDone.")
     return 0
@@ -1,11 +1,16 @@
 """Stage 4 — Normalize, deduplicate, and align XBRL financial data."""
 
 from sec_edgar.config import TAG_ALIASES, PRIORITY_CONCEPTS
+from sec_edgar.company_facts import FLAT_FIELDS
+
+# Frozen at import time — filter_priority used to rebuild this set per call.
+_PRIORITY_SET = frozenset(PRIORITY_CONCEPTS) | frozenset(TAG_ALIASES.values())
+_ALIASES = TAG_ALIASES
 
 
 def normalize_tag(tag: str) -> str:
     """Map variant XBRL tag names to a canonical name."""
-    return TAG_ALIASES.get(tag, tag)
+    return _ALIASES.get(tag, tag)
 
 
 def deduplicate(rows: list[dict]) -> list[dict]:
@@ -16,10 +21,11 @@ def deduplicate(rows: list[dict]) -> list[dict]:
     amendment (10-K/A).  Keep the row with the latest ``filed`` date for each
     unique (tag, end, fy, fp, unit) combination.
     """
+    alias_get = _ALIASES.get
     best: dict[tuple, dict] = {}
     for row in rows:
         key = (
-            normalize_tag(row["tag"]),
+            row.get("canonical_tag") or alias_get(row["tag"], row["tag"]),
             row.get("end"),
             row.get("fy"),
             row.get("fp"),
@@ -33,8 +39,12 @@ def deduplicate(rows: list[dict]) -> list[dict]:
 
 def filter_priority(rows: list[dict]) -> list[dict]:
     """Keep only rows whose tag (after alias resolution) is in PRIORITY_CONCEPTS."""
-    canonical = set(PRIORITY_CONCEPTS)
-    return [r for r in rows if normalize_tag(r["tag"]) in canonical]
+    alias_get = _ALIASES.get
+    return [
+        r
+        for r in rows
+        if (r.get("canonical_tag") or alias_get(r["tag"], r["tag"])) in _PRIORITY_SET
+    ]
 
 
 def normalize(
@@ -45,22 +55,76 @@ def normalize(
     Full normalisation pipeline:
 
     1. Add a ``canonical_tag`` field via alias resolution.
-    2. Deduplicate.
-    3. Optionally filter to priority concepts only.
+    2. Optionally filter to priority concepts only.
+    3. Deduplicate.
     4. Sort by (canonical_tag, end date, fiscal year).
+
+    All of steps 1-3 happen in a single pass over the rows — the separate
+    ``deduplicate``/``filter_priority`` helpers each re-touch the full row
+    list and are kept only for standalone use.
     """
-    # 1. Canonical tag
+    alias_get = _ALIASES.get
+    best: dict[tuple, dict] = {}
+    best_get = best.get
+
     for row in facts_rows:
-        row["canonical_tag"] = normalize_tag(row["tag"])
+        tag = row["tag"]
+        ctag = alias_get(tag, tag)
+        if priority_only and ctag not in _PRIORITY_SET:
+            continue
+        row["canonical_tag"] = ctag
+        row_get = row.get
+        key = (ctag, row_get("end"), row_get("fy"), row_get("fp"), row_get("unit"))
+        existing = best_get(key)
+        if existing is None or (row_get("filed", "") > existing.get("filed", "")):
+            best[key] = row
 
-    # 2. Deduplicate
-    rows = deduplicate(facts_rows)
+    return sorted(
+        best.values(),
+        key=lambda r: (r["canonical_tag"], r.get("end") or "", r.get("fy") or 0),
+    )
 
-    # 3. Filter
-    if priority_only:
-        rows = filter_priority(rows)
 
-    # 4. Sort
-    rows.sort(key=lambda r: (r["canonical_tag"], r.get("end") or "", r.get("fy") or 0))
+# Tuple-record field positions (see company_facts.FLAT_FIELDS).
+_TAG = FLAT_FIELDS.index("tag")
+_UNIT = FLAT_FIELDS.index("unit")
+_END = FLAT_FIELDS.index("end")
+_FY = FLAT_FIELDS.index("fy")
+_FP = FLAT_FIELDS.index("fp")
+_FILED = FLAT_FIELDS.index("filed")
+
 
+def normalize_records(records, priority_only: bool = False) -> list[dict]:
+    """
+    Normalise ``FLAT_FIELDS`` tuple records (from
+    ``extract_facts_flat_records``) without ever building dicts for rows
+    that get deduplicated or filtered away.
+
+    Same semantics and output as :func:`normalize`, but for a large filer
+    only the few thousand surviving rows are materialised as dicts instead
+    of all ~100k input rows.
+    """
+    alias_get = _ALIASES.get
+    best: dict[tuple, tuple] = {}  # key -> (filed, canonical_tag, record)
+    best_get = best.get
+
+    for rec in records:
+        tag = rec[_TAG]
+        ctag = alias_get(tag, tag)
+        if priority_only and ctag not in _PRIORITY_SET:
+            continue
+        key = (ctag, rec[_END], rec[_FY], rec[_FP], rec[_UNIT])
+        filed = rec[_FILED] or ""
+        existing = best_get(key)
+        if existing is None or filed > existing[0]:
+            best[key] = (filed, ctag, rec)
+
+    rows = []
+    rows_append = rows.append
+    for _filed, ctag, rec in best.values():
+        row = dict(zip(FLAT_FIELDS, rec))
+        row["canonical_tag"] = ctag
+        rows_append(row)
+
+    rows.sort(key=lambda r: (r["canonical_tag"], r.get("end") or "", r.get("fy") or 0))
     return rows
@@ -1,18 +1,27 @@
 """Stage 2 — Fetch and parse SEC filing submissions for a company."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 from sec_edgar.config import SUBMISSIONS_URL, KEY_FORM_TYPES
-from sec_edgar import http_client
+from sec_edgar import cache, fastjson, http_client
 
 
 def _parse_filings(recent: dict) -> list[dict]:
     """Turn the parallel-array format into a list of filing dicts."""
     keys = list(recent.keys())
-    count = len(recent[keys[0]]) if keys else 0
+    if not keys:
+        return []
+    # zip over the columns walks the parallel arrays in C instead of
+    # indexing recent[k][i] per key per row.
+    cols = [recent[k] for k in keys]
+    form_idx = keys.index("form") if "form" in keys else -1
+    key_forms = KEY_FORM_TYPES
     filings = []
-    for i in range(count):
-        filing = {k: recent[k][i] for k in keys}
-        filing["isKeyForm"] = filing.get("form", "") in KEY_FORM_TYPES
-        filings.append(filing)
+    append = filings.append
+    for row in zip(*cols):
+        filing = dict(zip(keys, row))
+        filing["isKeyForm"] = form_idx >= 0 and row[form_idx] in key_forms
+        append(filing)
     return filings
 
 
@@ -30,7 +39,7 @@ def fetch(cik: str, user_agent: str | None = None) -> dict:
         }
     """
     url = SUBMISSIONS_URL.format(cik=cik)
-    data = http_client.get(url, user_agent=user_agent).json()
+    data = cache.get_json(url, "submissions", cik, user_agent=user_agent)
 
     company = {
         "cik": data.get("cik"),
@@ -48,11 +57,20 @@ def fetch(cik: str, user_agent: str | None = None) -> dict:
     recent = data.get("filings", {}).get("recent", {})
     filings = _parse_filings(recent)
 
-    # Handle pagination — overflow files listed in data["filings"]["files"]
+    # Handle pagination — overflow files listed in data["filings"]["files"].
+    # Each is an independent network round-trip, so fetch them concurrently;
+    # the shared token bucket keeps the aggregate request rate in bounds.
     overflow_files = data.get("filings", {}).get("files", [])
-    for ref in overflow_files:
-        overflow_url = f"https://data.sec.gov/submissions/{ref['name']}"
-        overflow_data = http_client.get(overflow_url, user_agent=user_agent).json()
-        filings.extend(_parse_filings(overflow_data))
+    if overflow_files:
+
+        def _fetch_overflow(ref: dict) -> dict:
+            url = f"https://data.sec.gov/submissions/{ref['name']}"
+            return fastjson.loads(http_client.get(url, user_agent=user_agent).content)
+
+        with ThreadPoolExecutor(
+            max_workers=min(8, len(overflow_files))
+        ) as pool:
+            for overflow_data in pool.map(_fetch_overflow, overflow_files):
+                filings.extend(_parse_filings(overflow_data))
 
     return {"company": company, "filings": filings}
@@ -2,28 +2,88 @@
 
 import json
 import os
+import shutil
 import socket
 import sys
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 OUTPUT_DIR = Path(__file__).parent / "output"
 VIEWER_PATH = Path(__file__).parent / "viewer.html"
 
+# Viewer HTML held in memory; re-read only when the file's mtime changes.
+_viewer_cache = {"mtime": 0, "data": b""}
+
+
+def _viewer_bytes() -> bytes:
+    mtime = VIEWER_PATH.stat().st_mtime_ns
+    if mtime != _viewer_cache["mtime"]:
+        _viewer_cache["data"] = VIEWER_PATH.read_bytes()
+        _viewer_cache["mtime"] = mtime
+    return _viewer_cache["data"]
+
+
+# /api/files response cached against the output directory's mtime, which
+# changes whenever a file is added, removed, or renamed.  The full response
+# (status line + headers + body) is prebuilt so a cache hit is one write.
+_files_cache = {"mtime": -1, "resp": b""}
+
+
+def _files_response(protocol_version: str) -> bytes:
+    try:
+        mtime = OUTPUT_DIR.stat().st_mtime_ns
+    except OSError:
+        mtime = -1
+    if mtime != _files_cache["mtime"] or not _files_cache["resp"]:
+        if mtime == -1:
+            body = b"[]"
+        else:
+            # scandir's DirEntry carries the file type from the directory
+            # read itself — no fnmatch and no extra stat per entry.
+            with os.scandir(OUTPUT_DIR) as entries:
+                tickers = sorted(
+                    e.name[:-5]
+                    for e in entries
+                    if e.name.endswith(".json")
+                    and e.is_file(follow_symlinks=False)
+                )
+            body = json.dumps(tickers).encode()
+        head = (
+            f"{protocol_version} 200 OK\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n"
+        ).encode("latin-1")
+        _files_cache["resp"] = head + body
+        _files_cache["mtime"] = mtime
+    return _files_cache["resp"]
+
 
 class Handler(SimpleHTTPRequestHandler):
+    # Buffer response writes (64 KiB) so status line, headers, and small
+    # bodies coalesce into one send, and disable Nagle so that send isn't
+    # delayed waiting for more data.
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+
     def do_GET(self):
         if self.path == "/":
-            self._serve_file(VIEWER_PATH, "text/html")
+            self._send_bytes(_viewer_bytes(), "text/html")
         elif self.path == "/api/files":
-            tickers = sorted(
-                p.stem for p in OUTPUT_DIR.glob("*.json")
-            )
-            self._json_response(tickers)
+            self.wfile.write(_files_response(self.protocol_version))
         elif self.path.startswith("/api/data/"):
             ticker = self.path[len("/api/data/"):]
             fp = OUTPUT_DIR / f"{ticker}.json"
-            if fp.exists():
+            # Prefer the pre-compressed sibling written by write_json —
+            # 5-10× fewer bytes on the wire and zero compression CPU here.
+            gz = OUTPUT_DIR / f"{ticker}.json.gz"
+            if (
+                "gzip" in self.headers.get("Accept-Encoding", "")
+                and gz.exists()
+                and fp.exists()
+                and gz.stat().st_mtime >= fp.stat().st_mtime
+            ):
+                self._serve_file(gz, "application/json", encoding="gzip")
+            elif fp.exists():
                 self._serve_file(fp, "application/json")
             else:
                 self.send_error(404)
@@ -31,20 +91,40 @@ class Handler(SimpleHTTPRequestHandler):
             self.send_error(404)
 
     def _json_response(self, data):
-        body = json.dumps(data).encode()
+        self._send_bytes(json.dumps(data).encode(), "application/json")
+
+    def _send_bytes(self, body, content_type):
         self.send_response(200)
-        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Type", content_type)
         self.send_header("Content-Length", len(body))
         self.end_headers()
         self.wfile.write(body)
 
-    def _serve_file(self, path, content_type):
-        data = path.read_bytes()
-        self.send_response(200)
-        self.send_header("Content-Type", content_type)
-        self.send_header("Content-Length", len(data))
-        self.end_headers()
-        self.wfile.write(data)
+    def _serve_file(self, path, content_type, encoding=None):
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", size)
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            self.end_headers()
+            # Flush buffered headers, then let the kernel copy the body
+            # straight from the page cache to the socket — no userspace
+            # copy, O(1) memory regardless of file size.
+            self.wfile.flush()
+            try:
+                sent = 0
+                while sent < size:
+                    sent += os.sendfile(
+                        self.wfile.fileno(), f.fileno(), sent, size - sent
+                    )
+            except (AttributeError, OSError):
+                # No sendfile on this platform/socket — plain buffered copy.
+                if sent:
+                    raise  # partial transfer; can't cleanly fall back
+                f.seek(0)
+                shutil.copyfileobj(f, self.wfile)
 
     def log_message(self, fmt, *args):
         pass  # silent
@@ -52,7 +132,8 @@ class Handler(SimpleHTTPRequestHandler):
 
 def main():
     port = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
-    server = HTTPServer(("localhost", port), Handler)
+    server = ThreadingHTTPServer(("localhost", port), Handler)
+    server.daemon_threads = True  # don't block shutdown on open connections
     server.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     print(f"Open http://localhost:{port}")
     try: